@@ -273,22 +273,16 @@ if ((hasattr(args, 'import_cards') or hasattr(args, 'revert_series'))
     # Load images into server
     media_interface.set_title_cards(library, series_info, episode_map)
 
-# Create interface and remove records for indicated series+library
+# Remove records for indicated series+library - no server connection needed
 if (hasattr(args, 'forget_cards')
     and any((pp.use_emby, pp.use_jellyfin, pp.use_plex))):
     series_info = SeriesInfo(args.forget_cards[1], args.forget_cards[2])
     if args.media_server == 'emby':
-        EmbyInterface(**pp.emby_interface_kwargs).remove_records(
-            args.forget_cards[0], series_info,
-        )
+        EmbyInterface.forget_records(args.forget_cards[0], series_info)
     elif args.media_server == 'jellyfin':
-        JellyfinInterface(**pp.jellyfin_interface_kwargs).remove_records(
-            args.forget_cards[0], series_info,
-        )
+        JellyfinInterface.forget_records(args.forget_cards[0], series_info)
     else:
-        PlexInterface(**pp.plex_interface_kwargs).remove_records(
-            args.forget_cards[0], series_info,
-        )
+        PlexInterface.forget_records(args.forget_cards[0], series_info)
 
 
 # Execute Sonarr related options
@@ -288,6 +288,8 @@ class BaseCardType(ImageMaker):
         """
         Abstract method to create the title card outlined by the
         CardType. All implementations of this method should delete any
-        intermediate files.
+        intermediate files. Multiple cards can be created at once, so
+        this must not write to any intermediate file shared between
+        cards (e.g. a fixed path within TEMP_DIR).
         """
         raise NotImplementedError(f'All CardType objects must implement this')
\ No newline at end of file
@@ -1,5 +1,7 @@
+from functools import lru_cache
 from pathlib import Path as _Path_, _windows_flavour, _posix_flavour
 import os
+from typing import Optional
 
 from modules.Debug import log
 
@@ -28,9 +30,45 @@ class CleanPath(_Path_):
         '\\': '+',
     }
 
+    """Translation table of the above illegal characters"""
+    __ILLEGAL_TRANSLATION = str.maketrans(__ILLEGAL_FILE_CHARACTERS)
+
+    """Byte translation table and deletions of the above for ASCII names"""
+    __ASCII_TRANSLATION = bytes.maketrans(b'?*/\\', b'!-++')
+    __ASCII_DELETIONS = b'<>"|'
+
+    """Set of the above illegal characters for quick membership checks"""
+    __ILLEGAL_CHARACTERS = frozenset(__ILLEGAL_FILE_CHARACTERS)
+
+    """How many sanitized names to cache"""
+    SANITIZE_CACHE_SIZE = 4096
+
     """Implement the correct 'flavour' depending on the host OS"""
     _flavour = _windows_flavour if os.name == 'nt' else _posix_flavour
 
+    """
+    Current working directory, evaluated on first use. TitleCardMaker never
+    changes its working directory, so this is assumed fixed for the life of
+    the process
+    """
+    __CWD: Optional['CleanPath'] = None
+
+
+    @staticmethod
+    def _get_cwd() -> 'CleanPath':
+        """
+        Get the current working directory. This is only read from the
+        OS once, after which the same directory is always returned.
+
+        Returns:
+            The current working directory.
+        """
+
+        if CleanPath.__CWD is None:
+            CleanPath.__CWD = CleanPath.cwd()
+
+        return CleanPath.__CWD
+
 
     def finalize(self) -> 'CleanPath':
         """
@@ -45,13 +83,16 @@ class CleanPath(_Path_):
             unresolvable filename).
         """
 
-        return (CleanPath.cwd() / self).resolve()
+        return (CleanPath._get_cwd() / self).resolve()
 
 
     @staticmethod
+    @lru_cache(maxsize=SANITIZE_CACHE_SIZE)
     def sanitize_name(filename: str) -> str:
         """
         Sanitize the given filename to remove any illegal characters.
+        Results are cached, as the same series and season names are
+        sanitized repeatedly.
 
         Args:
             filename: Filename (string) to remove illegal characters
@@ -61,9 +102,14 @@ class CleanPath(_Path_):
             Sanitized filename.
         """
 
-        replacements = CleanPath.__ILLEGAL_FILE_CHARACTERS
+        # Most names are ASCII, translate those as bytes; only the multi-
+        # character replacement of : must be done separately
+        if filename.isascii():
+            return filename.encode('ascii').translate(
+                CleanPath.__ASCII_TRANSLATION, CleanPath.__ASCII_DELETIONS,
+            ).decode('ascii').replace(':', ' -')
 
-        return filename.translate(str.maketrans(replacements))
+        return filename.translate(CleanPath.__ILLEGAL_TRANSLATION)
 
 
     @staticmethod
@@ -79,10 +125,9 @@ class CleanPath(_Path_):
             with each folder (or part), except the root/drive, sanitized.
         """
 
-        return CleanPath(
-            path.parts[0],
-            *[CleanPath.sanitize_name(name) for name in path.parts[1:]]
-        )
+        parts = path.parts
+
+        return CleanPath(parts[0], *map(CleanPath.sanitize_name, parts[1:]))
 
 
     def sanitize(self) -> 'CleanPath':
@@ -94,11 +139,12 @@ class CleanPath(_Path_):
             part of this object's path.
         """
 
-        # Attempt to resolve immediately
-        try:
-            finalized_path = self.finalize()
-        # If path resolution raises an error, clean and then re-resolve
-        except Exception as e:
-            finalized_path =self._sanitize_parts(CleanPath.cwd()/self).resolve()
+        # Parts with illegal characters may not resolve, so clean those first;
+        # resolving does not add illegal characters, so this is already clean
+        illegal = CleanPath.__ILLEGAL_CHARACTERS
+        parts = self.parts[1:] if self.anchor else self.parts
+        if any(not illegal.isdisjoint(part) for part in parts):
+            return self._sanitize_parts(CleanPath._get_cwd() / self).resolve()
 
-        return self._sanitize_parts(finalized_path)
\ No newline at end of file
+        # Otherwise resolve immediately, then clean
+        return self._sanitize_parts(self.finalize())
\ No newline at end of file
@@ -1,6 +1,11 @@
 from pathlib import Path
 from typing import Any, Iterable
-from yaml import safe_load, dump
+
+from yaml import dump, load
+try:
+    from yaml import CSafeDumper as SafeDumper, CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeDumper, SafeLoader
 
 from modules.Debug import log
 from modules.EpisodeInfo import EpisodeInfo
@@ -62,7 +67,7 @@ class DataFileInterface:
         # Read file 
         with self.file.open('r', encoding='utf-8') as file_handle:
             try:
-                yaml = safe_load(file_handle)
+                yaml = load(file_handle, Loader=SafeLoader)
             except Exception as e:
                 log.error(f'Error reading datafile:\n{e}\n')
                 return {}
@@ -90,7 +95,8 @@ class DataFileInterface:
 
         # Write updated data with this entry added
         with self.file.open('w', encoding='utf-8') as file_handle:
-            dump({'data': yaml}, file_handle, allow_unicode=True, width=100)
+            dump({'data': yaml}, file_handle, Dumper=SafeDumper,
+                 allow_unicode=True, width=100)
 
 
     def read(self) -> tuple[dict[str, Any], set[str]]:
@@ -16,7 +16,6 @@ TQDM_KWARGS = {
 
 """Log file"""
 LOG_FILE = Path(__file__).parent.parent / 'logs' / 'maker.log'
-LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
 
 # Logger class that overrides exception calls to log message as error, and then
 # traceback as debug level of the exception only
@@ -29,14 +28,25 @@ setLoggerClass(BetterExceptionLogger)
 # StreamHandler to integrate log messages with TQDM
 class LogHandler(StreamHandler):
     def emit(self, record):
-        # Write after flushing buffer to integrate with tqdm
+        # Write through tqdm to integrate with progress bars; this writes to
+        # stdout directly, so this handler's own stream is never flushed
         try:
             tqdm.write(self.format(record))
-            self.flush()
         except Exception:
             self.handleError(record)
 
 
+# Rotating file handler that only creates (and opens) the log file when the
+# first record is written
+class LazyRotatingFileHandler(TimedRotatingFileHandler):
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, delay=True, **kwargs)
+
+    def _open(self):
+        Path(self.baseFilename).parent.mkdir(parents=True, exist_ok=True)
+        return super()._open()
+
+
 # Formatter classes to handle exceptions
 class ErrorFormatterColor(Formatter):
     def formatException(self, ei) -> str:
@@ -87,7 +97,7 @@ handler.setLevel(DEBUG)
 log.addHandler(handler)
 
 # Add rotating file handler to the logger
-file_handler = TimedRotatingFileHandler(
+file_handler = LazyRotatingFileHandler(
     filename=LOG_FILE, when='midnight', backupCount=7,
 )
 file_handler.setFormatter(ErrorFormatterNoColor(
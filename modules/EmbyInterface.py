@@ -1,5 +1,7 @@
 from base64 import b64encode
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from threading import Lock
 from typing import Optional, Union
 
 from modules.Debug import log
@@ -32,12 +34,15 @@ class EmbyInterface(EpisodeDataSource, MediaServer, SyncInterface):
     """Series ID's that can be set by Emby"""
     SERIES_IDS = ('emby_id', 'imdb_id', 'tmdb_id', 'tvdb_id')
 
-    """Datetime format string for airdates reported by Emby"""
-    AIRDATE_FORMAT = '%Y-%m-%dT%H:%M:%S.%f000000Z'
+    """Length of the date and time (YYYY-MM-DDTHH:MM:SS) of Emby airdates"""
+    AIRDATE_LENGTH = len('YYYY-MM-DDTHH:MM:SS')
 
     """Range of years to query series by"""
     YEAR_RANGE = range(1960, datetime.now().year)
 
+    """Maximum number of title cards to upload at once"""
+    MAX_CONCURRENT_UPLOADS = 8
+
 
     def __init__(self,
             url: str,
@@ -71,6 +76,9 @@ class EmbyInterface(EpisodeDataSource, MediaServer, SyncInterface):
         self.__params = {'api_key': api_key}
         self.username = username
 
+        # Loaded database is not thread-safe, guard concurrent card uploads
+        self.__loaded_db_lock = Lock()
+
         # Authenticate with server
         try:
             response = self.session._get(
@@ -121,7 +129,7 @@ class EmbyInterface(EpisodeDataSource, MediaServer, SyncInterface):
         return None
 
 
-    def _map_libraries(self) -> dict[str, tuple[int]]:
+    def _map_libraries(self) -> dict[str, tuple[str]]:
         """
         Map the libraries on this interface's Emby server.
 
@@ -139,7 +147,7 @@ class EmbyInterface(EpisodeDataSource, MediaServer, SyncInterface):
 
         # Parse each library name into tuples of parent ID's
         return {
-            lib['Name']:tuple(int(folder['Id']) for folder in lib['SubFolders'])
+            lib['Name']: tuple(folder['Id'] for folder in lib['SubFolders'])
             for lib in libraries
         }
 
@@ -173,8 +181,8 @@ class EmbyInterface(EpisodeDataSource, MediaServer, SyncInterface):
         if series_info.has_ids(*self.SERIES_IDS):
             return None
 
-        # If library not mapped, error and exit
-        if (library_ids := self.libraries.get(library_name)) is None:
+        # If library not mapped (or has no folders), error and exit
+        if not (library_ids := self.libraries.get(library_name)):
             log.error(f'Library "{library_name}" not found in Emby')
             return None
 
@@ -192,23 +200,25 @@ class EmbyInterface(EpisodeDataSource, MediaServer, SyncInterface):
             'IncludeItemTypes': 'series',
             'SearchTerm': series_info.name,
             'Fields': 'ProviderIds',
-        } | self.__params \
-          |({'AnyProviderIdEquals': provider_id_str} if provider_id_str else {})
+            **self.__params,
+        }
+        if provider_id_str:
+            params['AnyProviderIdEquals'] = provider_id_str
 
         # Look for this series in each library subfolder
         for parent_id in library_ids:
-            response = self.session._get(
-                f'{self.url}/Items',
-                params=params | {'ParentId': parent_id}
-            )
+            params['ParentId'] = parent_id
+            response = self.session._get(f'{self.url}/Items', params=params)
 
             # If no responses, skip
             if response['TotalRecordCount'] == 0: continue
 
-            # Go through all items and match name and type, setting database IDs
+            # Go through all items and match name and type, setting database
+            # IDs; check for an identical name before normalizing the name
             for result in response['Items']:
                 if (result['Type'] == 'Series'
-                    and series_info.matches(result['Name'])):
+                    and (result['Name'] == series_info.name
+                         or series_info.matches(result['Name']))):
                     ids = result.get('ProviderIds', {})
                     # No MediaInfoSet, set directly
                     if self.info_set is None:
@@ -317,11 +327,12 @@ class EmbyInterface(EpisodeDataSource, MediaServer, SyncInterface):
             'Recursive': True,
             'IncludeItemTypes': 'series',
             'Fields': 'ProviderIds,Path',
-        } | self.__params
+            **self.__params,
+        }
 
         # Also filter by tags if any were provided
         if len(required_tags) > 0:
-            params |= {'Tags': '|'.join(required_tags)}
+            params['Tags'] = '|'.join(required_tags)
 
         # Go through each library in this server
         all_series = []
@@ -332,12 +343,13 @@ class EmbyInterface(EpisodeDataSource, MediaServer, SyncInterface):
 
             # Go through every subfolder (the parent ID) in this library
             for parent_id in library_ids:
+                params['ParentId'] = parent_id
                 # Have to query year by year, for SOME stupid reason...
                 for year in self.YEAR_RANGE:
                     # Get all items (series) in this subfolder for this year
+                    params['Years'] = year
                     response = self.session._get(
-                        f'{self.url}/Items',
-                        params=params | {'ParentId': parent_id, 'Years': year}
+                        f'{self.url}/Items', params=params
                     )
 
                     for series in response['Items']:
@@ -376,17 +388,26 @@ class EmbyInterface(EpisodeDataSource, MediaServer, SyncInterface):
         # Get all episodes for this series
         response = self.session._get(
             f'{self.url}/Shows/{series_info.emby_id}/Episodes',
-            params={'Fields': 'ProviderIds'} | self.__params
+            params={'Fields': 'ProviderIds', **self.__params}
         )
 
+        # Index any given EpisodeInfos by season and episode number
+        indexed_infos: dict[tuple[int, int], EpisodeInfo] = {}
+        for episode_info in (episode_infos or []):
+            indexed_infos.setdefault(
+                (episode_info.season_number, episode_info.episode_number),
+                episode_info,
+            )
+
         # Parse each returned episode into EpisodeInfo object
         all_episodes = []
         for episode in response['Items']:
             # Parse airdate for this episode
             airdate=None
             try:
-                airdate = datetime.strptime(episode['PremiereDate'],
-                                            self.AIRDATE_FORMAT)
+                airdate = datetime.fromisoformat(
+                    episode['PremiereDate'][:self.AIRDATE_LENGTH]
+                )
             except Exception as e:
                 log.exception(f'Cannot parse airdate', e)
                 log.debug(f'Episode data: {episode}')
@@ -411,20 +432,16 @@ class EmbyInterface(EpisodeDataSource, MediaServer, SyncInterface):
                 # Add to list
                 if episode_info is not None:
                     all_episodes.append(episode_info)
-            # If updating existing infos, match by index
-            else:
-                tmp_ei = (episode['ParentIndexNumber'], episode['IndexNumber'])
-                for episode_info in episode_infos:
-                    # Index match, update ID's
-                    if episode_info == tmp_ei:
-                        ep_ids = episode['ProviderIds']
-                        episode_info.set_emby_id(episode.get('Id'))
-                        episode_info.set_imdb_id(ep_ids.get('Imdb'))
-                        episode_info.set_tmdb_id(ep_ids.get('Tmdb'))
-                        episode_info.set_tvdb_id(ep_ids.get('Tvdb'))
-                        episode_info.set_tvrage_id(ep_ids.get('TvRage'))
-                        all_episodes.append(episode_info)
-                        break
+            # If updating existing infos, match by index and update ID's
+            elif (episode_info := indexed_infos.get(
+                    (episode['ParentIndexNumber'], episode['IndexNumber']))):
+                ep_ids = episode['ProviderIds']
+                episode_info.set_emby_id(episode.get('Id'))
+                episode_info.set_imdb_id(ep_ids.get('Imdb'))
+                episode_info.set_tmdb_id(ep_ids.get('Tmdb'))
+                episode_info.set_tvdb_id(ep_ids.get('Tvdb'))
+                episode_info.set_tvrage_id(ep_ids.get('TvRage'))
+                all_episodes.append(episode_info)
 
         return all_episodes
 
@@ -476,7 +493,7 @@ class EmbyInterface(EpisodeDataSource, MediaServer, SyncInterface):
         # Query for all episodes of this series
         response = self.session._get(
             f'{self.url}/Shows/{series_info.emby_id}/Episodes',
-            params={'UserId': self.user_id} | self.__params
+            params={'UserId': self.user_id, **self.__params}
         )
 
         # Go through each episode in Emby, update Episode status/card
@@ -536,35 +553,62 @@ class EmbyInterface(EpisodeDataSource, MediaServer, SyncInterface):
         if len(filtered_episodes) == 0:
             return None
 
-        # Go through each remaining episode and load the card
-        loaded_count = 0
-        for episode in filtered_episodes.values():
-            # Skip episodes without Emby ID's (e.g. not in Emby)
-            if (emby_id := episode.episode_info.emby_id) is None:
-                continue
+        # Upload each remaining episode's card concurrently
+        with ThreadPoolExecutor(self.MAX_CONCURRENT_UPLOADS) as executor:
+            loaded_count = sum(executor.map(
+                lambda episode: self.__upload_card(
+                    library_name, series_info, episode
+                ),
+                filtered_episodes.values(),
+            ))
 
-            # Shrink image if necessary, skip if cannot be compressed
-            if (card := self.compress_image(episode.destination)) is None:
-                continue
+        # Log load operations to user
+        if loaded_count > 0:
+            log.info(f'Loaded {loaded_count} cards for "{series_info}"')
 
-            # Image content must be Base64-encoded
-            card_base64 = b64encode(card.read_bytes())
 
-            # Submit POST request for image upload
-            try:
-                self.session.session.post(
-                    url=f'{self.url}/Items/{emby_id}/Images/Primary',
-                    headers={'Content-Type': 'image/jpeg'},
-                    params=self.__params,
-                    data=card_base64,
-                )
-                loaded_count += 1
-            except Exception as e:
-                log.exception(f'Unable to upload {card.resolve()} to '
-                              f'{series_info}', e)
-                continue
+    def __upload_card(self,
+            library_name: str,
+            series_info: SeriesInfo,
+            episode: Episode) -> bool:
+        """
+        Upload the title card of the given episode, and record it in
+        the loaded database.
+
+        Args:
+            library_name: The name of the library containing the series.
+            series_info: The series the episode belongs to.
+            episode: Episode whose card is being uploaded.
+
+        Returns:
+            Whether the card was uploaded.
+        """
 
-            # Update loaded database for this episode
+        # Skip episodes without Emby ID's (e.g. not in Emby)
+        if (emby_id := episode.episode_info.emby_id) is None:
+            return False
+
+        # Shrink image if necessary, skip if cannot be compressed
+        if (card := self.compress_image(episode.destination)) is None:
+            return False
+
+        # Submit POST request for image upload, content must be Base64
+        try:
+            self.session.session.post(
+                url=f'{self.url}/Items/{emby_id}/Images/Primary',
+                headers={'Content-Type': 'image/jpeg'},
+                params=self.__params,
+                data=b64encode(card.read_bytes()),
+            )
+        except Exception as e:
+            log.exception(f'Unable to upload {card.resolve()} to '
+                          f'{series_info}', e)
+            return False
+        finally:
+            self._delete_compressed_image(episode.destination, card)
+
+        # Update loaded database for this episode
+        with self.__loaded_db_lock:
             self.loaded_db.upsert({
                 'library': library_name,
                 'series': series_info.full_name,
@@ -574,9 +618,7 @@ class EmbyInterface(EpisodeDataSource, MediaServer, SyncInterface):
                 'spoiler': episode.spoil_type,
             }, self._get_condition(library_name, series_info, episode))
 
-        # Log load operations to user
-        if loaded_count > 0:
-            log.info(f'Loaded {loaded_count} cards for "{series_info}"')
+        return True
 
 
     def set_season_posters(self,
@@ -619,7 +661,7 @@ class EmbyInterface(EpisodeDataSource, MediaServer, SyncInterface):
         # Get the source image for this episode
         response = self.session.session.get(
             f'{self.url}/Items/{episode_info.emby_id}/Images/Primary',
-            params={'Quality': 100} | self.__params,
+            params={'Quality': 100, **self.__params},
         ).content
 
         # Check if valid content was returned
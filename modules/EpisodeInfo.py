@@ -1,4 +1,5 @@
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Optional, Union
 
 from num2words import num2words
@@ -14,6 +15,30 @@ class WordSet(dict):
     of numbers.
     """
 
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _wordify(number: int, to: str, lang: str = 'en') -> str:
+        """
+        Convert the given number to words. Conversions are cached, as
+        the same season and episode numbers are converted for many
+        episodes.
+
+        Args:
+            number: Number to wordify.
+            to: Which type of conversion - e.g. 'cardinal' or 'ordinal'.
+            lang: Language to wordify the number into.
+
+        Returns:
+            The wordified number.
+
+        Raises:
+            NotImplementedError if the language does not support the
+            conversion.
+        """
+
+        return num2words(number, to=to, lang=lang)
+
+
     def add_numeral(self,
             label: str,
             number: int,
@@ -49,18 +74,18 @@ class WordSet(dict):
         if lang:
             # Catch exceptions caused by an unsupported language
             try:
-                cardinal = num2words(number, to='cardinal', lang=lang)
+                cardinal = self._wordify(number, 'cardinal', lang)
                 self.update({f'{label}_cardinal_{lang}': cardinal})
             except NotImplementedError: pass
             try:
-                ordinal = num2words(number, to='ordinal', lang=lang)
+                ordinal = self._wordify(number, 'ordinal', lang)
                 self.update({f'{label}_ordinal_{lang}': ordinal})
             except NotImplementedError: pass
         # No language indicated, convert using base language
         else:
             self.update({
-                f'{label}_cardinal': num2words(number, to='cardinal'),
-                f'{label}_ordinal': num2words(number, to='ordinal'),
+                f'{label}_cardinal': self._wordify(number, 'cardinal'),
+                f'{label}_ordinal': self._wordify(number, 'ordinal'),
             })
 
 
@@ -27,8 +27,9 @@ class Font(YamlReader):
 
     __slots__ = (
         '__card_class', '__series_info', '__validator', '__validate', 'color',
-        'size', 'file', 'replacements', 'delete_missing', 'case_name', 'case',
-        'vertical_shift', 'interline_spacing', 'kerning', 'stroke_width',
+        'size', 'file', 'replacements', 'replacement_table', 'delete_missing',
+        'case_name', 'case', 'vertical_shift', 'interline_spacing', 'kerning',
+        'stroke_width',
     )
 
 
@@ -179,6 +180,35 @@ class Font(YamlReader):
             else:
                 self.__error('stroke_width', value, 'specify as "x%"')
 
+        # Update translation table for any modified replacements
+        self.replacement_table = self._get_replacement_table(self.replacements)
+
+
+    @staticmethod
+    def _get_replacement_table(
+            replacements: dict[str, str]) -> Optional[dict[int, str]]:
+        """
+        Get the translation table equivalent to applying the given
+        replacements one after another.
+
+        Args:
+            replacements: Dictionary of font replacements.
+
+        Returns:
+            Translation table for str.translate, or None if the
+            replacements cannot be applied in a single pass - i.e. any
+            replacement is not a single character, or produces text that
+            another replacement would modify.
+        """
+
+        if any(len(old) != 1 for old in replacements):
+            return None
+        if any(old in new for new in replacements.values()
+               for old in replacements):
+            return None
+
+        return str.maketrans(replacements)
+
 
     def reset(self) -> None:
         """Reset this object's attributes to its default values."""
@@ -191,6 +221,7 @@ class Font(YamlReader):
         self.size = 1.0
         self.file = self.__card_class.TITLE_FONT
         self.replacements = self.__card_class.FONT_REPLACEMENTS
+        self.replacement_table = self._get_replacement_table(self.replacements)
         self.delete_missing = True
         self.case_name = self.__card_class.DEFAULT_FONT_CASE
         self.case = self.__card_class.CASE_FUNCTIONS[self.case_name]
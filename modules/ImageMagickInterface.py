@@ -24,8 +24,8 @@ class ImageMagickInterface:
     """How long to wait before terminating a command as timed out"""
     COMMAND_TIMEOUT_SECONDS = 240
 
-    """Characters that must be escaped in commands"""
-    __REQUIRED_ESCAPE_CHARACTERS = ('"', '`', '%')
+    """Translation table escaping the characters required in commands"""
+    __ESCAPE_TABLE = str.maketrans({char: f'\\{char}' for char in '"`%'})
 
     """Substrings that must be present in --version output"""
     __REQUIRED_VERSION_SUBSTRINGS = ('Version','Copyright','License','Features')
@@ -92,10 +92,7 @@ class ImageMagickInterface:
         if string is None:
             return None
 
-        for char in ImageMagickInterface.__REQUIRED_ESCAPE_CHARACTERS:
-            string = string.replace(char, f'\{char}')
-
-        return string
+        return string.translate(ImageMagickInterface.__ESCAPE_TABLE)
 
 
     def run(self, command: str) -> tuple[bytes, bytes]:
@@ -1,7 +1,8 @@
 from abc import ABC, abstractmethod
 from collections import namedtuple
 from pathlib import Path
-from re import findall, match
+from re import compile as re_compile, match
+from threading import get_ident, Lock
 from typing import Literal, Optional, Union
 
 from modules.Debug import log
@@ -29,8 +30,11 @@ class ImageMaker(ABC):
     """Temporary file location for svg -> png conversion"""
     TEMPORARY_SVG_FILE = TEMP_DIR / 'temp_logo.svg'
 
-    """Temporary file location for image filesize reduction"""
-    TEMPORARY_COMPRESS_FILE = TEMP_DIR / 'temp_compress.jpg'
+    """
+    Temporary file location for image filesize reduction - each thread
+    uses its own file so concurrent reductions do not overwrite another
+    """
+    TEMPORARY_COMPRESS_FILE_FORMAT = 'temp_compress_{thread}.jpg'
 
     """
     Valid file extensions for input images - ImageMagick supports more
@@ -39,6 +43,19 @@ class ImageMaker(ABC):
     """
     VALID_IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.tiff', '.gif', '.webp')
 
+    """Regexes to parse the text metrics output by ImageMagick"""
+    _WIDTH_REGEX = re_compile(r'Metrics:.*width:\s+(\d+)')
+    _HEIGHT_REGEX = re_compile(r'Metrics:.*height:\s+(\d+)')
+
+    """
+    Previously measured text dimensions, keyed by the measuring command
+    and processing methods. Text like season titles is measured for
+    every card, so this avoids re-running identical ImageMagick commands
+    """
+    TEXT_DIMENSIONS_CACHE_SIZE = 1000
+    _text_dimensions_cache: dict[tuple[str, str, str], Dimensions] = {}
+    _text_dimensions_lock = Lock()
+
     __slots__ = ('preferences', 'image_magick')
 
 
@@ -132,17 +149,24 @@ class ImageMaker(ABC):
             f'null: 2>&1',
         ])
 
+        # Return previously measured dimensions of identical text
+        cache_key = (text_command, width, height)
+        with self._text_dimensions_lock:
+            dimensions = self._text_dimensions_cache.get(cache_key)
+        if dimensions:
+            return dimensions
+
         # Execute dimension command, parse output
         metrics = self.image_magick.run_get_output(text_command)
-        widths = map(int, findall(r'Metrics:.*width:\s+(\d+)', metrics))
-        heights = map(int, findall(r'Metrics:.*height:\s+(\d+)', metrics))
+        widths = map(int, self._WIDTH_REGEX.findall(metrics))
+        heights = map(int, self._HEIGHT_REGEX.findall(metrics))
 
         try:
             # Label text produces duplicate Metrics
             sum_ = lambda v: sum(v)//(2 if ' label:"' in text_command else 1)
 
             # Process according to given methods
-            return Dimensions(
+            dimensions = Dimensions(
                 sum_(widths)  if width  == 'sum' else max(widths),
                 sum_(heights) if height == 'sum' else max(heights),
             )
@@ -150,9 +174,22 @@ class ImageMaker(ABC):
             log.debug(f'Cannot identify text dimensions - {e}')
             return Dimensions(0, 0)
 
+        # Store these dimensions, evicting the oldest if the cache is full.
+        # Cards are created concurrently, so modify the cache under the lock
+        with self._text_dimensions_lock:
+            cache = ImageMaker._text_dimensions_cache
+            if len(cache) >= self.TEXT_DIMENSIONS_CACHE_SIZE:
+                cache.pop(next(iter(cache), None), None)
+            cache[cache_key] = dimensions
+
+        return dimensions
+
 
     @staticmethod
-    def reduce_file_size(image: Path, quality: int = 90) -> Path:
+    def reduce_file_size(
+            image: Path,
+            quality: int = 90, *,
+            filesize_limit: Optional[int] = None) -> Path:
         """
         Reduce the file size of the given image.
 
@@ -160,6 +197,10 @@ class ImageMaker(ABC):
             image: Path to the image to reduce the file size of.
             quality: Quality of the reduction. 100 being no reduction, 0
                 being complete reduction. Passed to ImageMagick -quality.
+            filesize_limit: (Keyword only) Number of bytes to limit the
+                reduced image to. If provided, ImageMagick searches for
+                the highest quality below this limit, and quality is
+                ignored.
 
         Returns:
             Path to the created image.
@@ -183,17 +224,27 @@ class ImageMaker(ABC):
         )
 
         # Downsample and reduce quality of source image
+        filename = ImageMaker.TEMPORARY_COMPRESS_FILE_FORMAT.format(
+            thread=get_ident()
+        )
+        compressed_image = ImageMaker.TEMP_DIR / filename
+        if filesize_limit is None:
+            quality_command = f'-quality {quality}%'
+        else:
+            quality_command = f'-define jpeg:extent={filesize_limit}'
         command = ' '.join([
             f'convert',
             f'"{image.resolve()}"',
             f'-sampling-factor 4:2:0',
-            f'-quality {quality}%',
-            f'"{ImageMaker.TEMPORARY_COMPRESS_FILE.resolve()}"',
+            quality_command,
+            f'"{compressed_image.resolve()}"',
         ])
 
+        # Delete any previous compression so a failed command is not hidden
+        compressed_image.unlink(missing_ok=True)
         image_magick_interface.run(command)
 
-        return ImageMaker.TEMPORARY_COMPRESS_FILE
+        return compressed_image
 
 
     @staticmethod
@@ -562,6 +562,8 @@ class JellyfinInterface(EpisodeDataSource, MediaServer, SyncInterface):
                 log.exception(f'Unable to upload {card.resolve()} to '
                               f'"{series_info}"', e)
                 continue
+            finally:
+                self._delete_compressed_image(episode.destination, card)
 
             # Update loaded database for this episode
             self.loaded_db.upsert({
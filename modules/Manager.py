@@ -410,10 +410,15 @@ class Manager:
     def run(self) -> None:
         """Run the Manager either in either serial or batch mode"""
 
-        if self.preferences.execution_mode == 'serial':
-            self.__run_serially()
-        elif self.preferences.execution_mode == 'batch':
-            self.__run()
+        try:
+            if self.preferences.execution_mode == 'serial':
+                self.__run_serially()
+            elif self.preferences.execution_mode == 'batch':
+                self.__run()
+        finally:
+            # Release the TMDb blacklist database until the next run
+            if self.tmdb_interface:
+                self.tmdb_interface.close()
 
 
     def remake_cards(self, rating_keys: Iterable[int]) -> None:
@@ -471,6 +476,10 @@ class Manager:
                         f' within library "{library_name}" - no matching YAML '
                         f'entry was found')
 
+        # Release the TMDb blacklist database
+        if self.tmdb_interface:
+            self.tmdb_interface.close()
+
 
     def report_missing(self, file: 'Path') -> None:
         """Report all missing assets for all shows."""
@@ -54,7 +54,9 @@ class MediaServer(ABC):
 
     def compress_image(self, image: Path) -> Optional[Path]:
         """
-        Compress the given image until below the filesize limit.
+        Compress the given image until below the filesize limit. Any
+        compressed copy should be deleted (with _delete_compressed_image)
+        once it has been uploaded.
 
         Args:
             image: Path to the image to compress.
@@ -72,26 +74,43 @@ class MediaServer(ABC):
             or image.stat().st_size < self.filesize_limit):
             return image
 
-        # Start with a quality of 90%, decrement by 5% each time
-        quality = 95
-        small_image = image
-
-        # Compress the given image until below the filesize limit
-        while small_image.stat().st_size > self.filesize_limit:
-            # Process image, exit if cannot be reduced
-            quality -= 5
-            small_image = ImageMaker.reduce_file_size(image, quality)
-            if small_image is None:
-                log.warning(f'Cannot reduce filesize of "{image.resolve()}" '
-                            f'below limit')
-                return None
+        # Compress the given image below the filesize limit; ImageMagick
+        # searches for the best quality within a single process
+        small_image = ImageMaker.reduce_file_size(
+            image, filesize_limit=self.filesize_limit
+        )
+        if (small_image is None
+            or not small_image.exists()
+            or small_image.stat().st_size > self.filesize_limit):
+            log.warning(f'Cannot reduce filesize of "{image.resolve()}" '
+                        f'below limit')
+            if small_image is not None:
+                small_image.unlink(missing_ok=True)
+            return None
 
         # Compression successful, log and return intermediate image
-        log.debug(f'Compressed "{image.resolve()}" with {quality}% quality')
+        log.debug(f'Compressed "{image.resolve()}" below '
+                  f'{self.filesize_limit} bytes')
         return small_image
 
 
-    def _get_condition(self,
+    @staticmethod
+    def _delete_compressed_image(image: Path, compressed_image: Path) -> None:
+        """
+        Delete the given compressed copy of an image, if compress_image
+        made one.
+
+        Args:
+            image: Path to the image that was compressed.
+            compressed_image: Path returned by compress_image for image.
+        """
+
+        if compressed_image != Path(image):
+            compressed_image.unlink(missing_ok=True)
+
+
+    @staticmethod
+    def _get_condition(
             library_name: str,
             series_info: SeriesInfo,
             episode: Episode = None) -> Query:
@@ -202,25 +221,62 @@ class MediaServer(ABC):
         return filtered
 
 
-    def remove_records(self, library_name: str, series_info: SeriesInfo) ->None:
+    @classmethod
+    def _delete_records(cls,
+            database: PersistentDatabase,
+            library_name: str,
+            series_info: SeriesInfo) -> None:
         """
         Remove all records for the given library and series from the
-        loaded database.
+        given loaded database.
 
         Args:
+            database: The loaded database to remove records from.
             library_name: The name of the library containing the series
                 whose records are being removed.
             series_info: SeriesInfo whose records are being removed.
         """
 
         # Get condition to find records matching this library + series
-        condition = self._get_condition(library_name, series_info)
+        condition = cls._get_condition(library_name, series_info)
 
         # Delete records matching this condition
-        records = self.loaded_db.remove(condition)
+        records = database.remove(condition)
         log.info(f'Deleted {len(records)} records')
 
 
+    def remove_records(self, library_name: str, series_info: SeriesInfo) ->None:
+        """
+        Remove all records for the given library and series from the
+        loaded database.
+
+        Args:
+            library_name: The name of the library containing the series
+                whose records are being removed.
+            series_info: SeriesInfo whose records are being removed.
+        """
+
+        self._delete_records(self.loaded_db, library_name, series_info)
+
+
+    @classmethod
+    def forget_records(cls, library_name: str, series_info: SeriesInfo) ->None:
+        """
+        Remove all records for the given library and series from the
+        loaded database of this class of MediaServer. This does not
+        require an instance, so no connection to the server is made.
+
+        Args:
+            library_name: The name of the library containing the series
+                whose records are being removed.
+            series_info: SeriesInfo whose records are being removed.
+        """
+
+        cls._delete_records(
+            PersistentDatabase(cls.LOADED_DB), library_name, series_info
+        )
+
+
     @abstractmethod
     def has_series(self) -> bool:
         """
@@ -709,6 +709,8 @@ class PlexInterface(EpisodeDataSource, MediaServer, SyncInterface):
                 continue
             else:
                 loaded_count += 1
+            finally:
+                self._delete_compressed_image(episode.destination, card)
 
             # Update/add loaded map with this entry
             self.loaded_db.upsert({
@@ -782,6 +784,8 @@ class PlexInterface(EpisodeDataSource, MediaServer, SyncInterface):
                 continue
             else:
                 loaded_count += 1
+            finally:
+                self._delete_compressed_image(poster, resized_poster)
 
             # Update loaded database
             self.__posters.upsert({
@@ -96,6 +96,7 @@ class PreferenceParser(YamlReader):
         self.card_filename_format = TitleCard.DEFAULT_FILENAME_FORMAT
         self.card_extension = TitleCard.DEFAULT_CARD_EXTENSION
         self.card_dimensions = TitleCard.DEFAULT_CARD_DIMENSIONS
+        self.card_concurrency = TitleCard.DEFAULT_CARD_CONCURRENCY
         self.image_source_priority = ('tmdb', 'plex', 'emby', 'jellyfin')
         self.episode_data_source = self.DEFAULT_EPISODE_DATA_SOURCE
         self.validate_fonts = True
@@ -440,6 +441,14 @@ class PreferenceParser(YamlReader):
                              f'be larger than 0px')
                 self.valid = False
 
+        if (value := self._get('options', 'card_concurrency',
+                               type_=int)) is not None:
+            if value < 1:
+                log.critical(f'Card concurrency must be at least 1')
+                self.valid = False
+            else:
+                self.card_concurrency = value
+
         if (value := self._get('options', 'filename_format', type_=str)) !=None:
             if TitleCard.validate_card_format_string(value):
                 self.card_filename_format = value
@@ -374,7 +374,10 @@ class Profile:
         else:
             cased_title = self.font.case(title_text)
 
-        # Apply font replacements
+        # Apply font replacements, in one pass if possible
+        if (table := self.font.replacement_table) is not None:
+            return cased_title.translate(table)
+
         replaced_title = cased_title
         for old, new in self.font.replacements.items():
             replaced_title = replaced_title.replace(old, new)
@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from copy import copy
 from pathlib import Path
 from typing import Literal, Optional
@@ -209,24 +210,58 @@ class Show(YamlReader):
                 will utilize.
 
         Returns:
-            A newly constructed Show object with a modified
-            'media_directory' and 'watched_style' attributes.
+            A copy of this Show object with a modified 'media_directory'
+            and 'watched_style' attributes. Any attributes modified by
+            profile conversion are copies, all others are shared with
+            this object.
         """
 
         # Modify base yaml to have overritten media_directory
         modified_base = copy(self._base_yaml)
         modified_base['media_directory'] = str(media_directory.resolve())
 
-        # Set watched_style to archive style (if set)
+        # Copy this Show rather than re-parsing the (modified) YAML
+        show = copy(self)
+        show._base_yaml = modified_base
+        show.media_directory = CleanPath(
+            modified_base['media_directory']
+        ).sanitize()
+
+        # Set watched_style to archive style (if set), recreate StyleSet
         if (value := self._get('archive_style', type_=str)) is not None:
             modified_base['watched_style'] = value
+        show.style_set = copy(self.style_set)
+        if show._is_specified('watched_style'):
+            show.style_set.update_watched_style(
+                show._get('watched_style', type_=str)
+            )
+        if show._is_specified('unwatched_style'):
+            show.style_set.update_unwatched_style(
+                show._get('unwatched_style', type_=str)
+            )
+        show.valid &= show.style_set.valid
+
+        # Profile conversion modifies the Font, EpisodeMap, and extras
+        show.font = copy(self.font)
+        show.__episode_map = copy(self.__episode_map)
+        show.extras = copy(self.extras)
+        show.profile = Profile(
+            show.series_info,
+            show.font,
+            show.hide_seasons,
+            show.__episode_map,
+            show.episode_text_format,
+        )
 
-        # Recreate Show object with modified YAML
-        show = Show(
-            self.series_info.full_name, modified_base,
-            self.source_directory.parent,
-            self.preferences
+        # Season posters are created within the new media directory
+        show.season_poster_set = SeasonPosterSet(
+            show.__episode_map,
+            show.source_directory,
+            show.media_directory,
+            show._get('season_posters'),
         )
+
+        show.episodes = {}
         show.__is_archive = True
 
         return show
@@ -822,6 +857,12 @@ class Show(YamlReader):
             if url and self.tmdb_interface.download_image(url, self.backdrop):
                 log.debug(f'Downloaded backdrop for {self} from tmdb')
 
+        # Skip all server queries if no episode needs a source image
+        if not any(episode.downloadable_source and not episode.source.exists()
+                   for episode in self.episodes.values()
+                   if select_only is None or episode is select_only):
+            return None
+
         # Whether to always check each interface
         always_check_emby = (
             bool(self.emby_interface)
@@ -970,12 +1011,15 @@ class Show(YamlReader):
             self.episodes[f'0{mp.season_number}-{mp.episode_start}'] = mp
 
 
-    def create_missing_title_cards(self) -> None:
-        """Create any missing title cards for each episode."""
+    def _get_missing_title_cards(self) -> list[TitleCard]:
+        """
+        Get the TitleCards of each episode whose card is missing. If
+        this Show's config has changed, existing cards are deleted
+        first.
 
-        # If the media directory is unspecified, exit
-        if self.media_directory is None:
-            return None
+        Returns:
+            List of TitleCards to create.
+        """
 
         # See if these cards need to be deleted/updated for new config
         if global_objects.show_record_keeper.is_updated(self):
@@ -983,8 +1027,9 @@ class Show(YamlReader):
             for episode in self.episodes.values():
                 episode.delete_card(reason='new config')
 
-        # Go through each episode for this show
-        for episode in (pbar := tqdm(self.episodes.values(), **TQDM_KWARGS)):
+        # Go through each episode for this show, getting the cards to create
+        title_cards = []
+        for episode in self.episodes.values():
             # Skip episodes without a destination or that already exist
             if not episode.destination or episode.destination.exists():
                 continue
@@ -994,9 +1039,6 @@ class Show(YamlReader):
                 and not episode.source.exists()):
                 continue
 
-            # Update progress bar
-            pbar.set_description(f'Creating {episode}')
-
             # Create a TitleCard object for this episode with Show's profile
             title_card = TitleCard(
                 episode,
@@ -1014,8 +1056,51 @@ class Show(YamlReader):
                 log.warning(f'Invalid font for {episode} of {self}')
                 continue
 
-            # Source exists, create the title card
-            title_card.create()
+            title_cards.append(title_card)
+
+        return title_cards
+
+
+    @staticmethod
+    def _create_title_cards(title_cards: list[TitleCard], name: str) -> None:
+        """
+        Create the given title cards concurrently. Each card is created
+        by its own ImageMagick process, so threads are enough; at most
+        the global card concurrency are created at once.
+
+        Args:
+            title_cards: TitleCards to create.
+            name: Name of what the cards are for, for the progress bar.
+        """
+
+        if not title_cards:
+            return None
+
+        max_workers = global_objects.pp.card_concurrency
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(card.create): card for card in title_cards
+            }
+            for future in tqdm(as_completed(futures), total=len(futures),
+                               desc=f'Creating cards for {name}',
+                               **TQDM_KWARGS):
+                # Log any uncaught errors raised while creating this card
+                try:
+                    future.result()
+                except Exception as e:
+                    log.exception(f'Error creating card '
+                                  f'"{futures[future].file.resolve()}"', e)
+
+
+    def create_missing_title_cards(self) -> None:
+        """Create any missing title cards for each episode."""
+
+        # If the media directory is unspecified, exit
+        if self.media_directory is None:
+            return None
+
+        # Create the missing title cards
+        self._create_title_cards(self._get_missing_title_cards(), str(self))
 
         # Update record keeeper
         global_objects.show_record_keeper.add_config(self)
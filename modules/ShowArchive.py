@@ -1,7 +1,8 @@
 from pathlib import Path
-from typing import Any, Callable
+from typing import Callable
 from modules.Debug import log
 import modules.global_objects as global_objects
+from modules.Show import Show
 
 class ShowArchive:
     """
@@ -64,6 +65,9 @@ class ShowArchive:
             card_class, base_show.archive_all_variations,
         )
 
+        # All profile directories are within this series' archive directory
+        series_directory = archive_directory/base_show.series_info.full_clean_name
+
         # Go through each valid profile
         for attributes in valid_profiles:
             # Get directory name for this profile
@@ -79,12 +83,10 @@ class ShowArchive:
             else:
                 profile_directory = base_show.archive_name
 
-            # Get modified media directory within the archive directory
-            temp_path = archive_directory /base_show.series_info.full_clean_name
-            new_media_directory = temp_path / profile_directory
-
             # Create modified Show object for this profile
-            new_show = base_show._make_archive(new_media_directory)
+            new_show = base_show._make_archive(
+                series_directory / profile_directory
+            )
 
             # Convert this new show's profile if no manual archive name
             if base_show.archive_name is None:
@@ -145,6 +147,27 @@ class ShowArchive:
         return wrapper
 
 
+    def create_missing_title_cards(self) -> None:
+        """
+        Create any missing title cards for each profile's Show in this
+        Archive. The cards of all profiles are created together, so that
+        they are created concurrently across profiles.
+        """
+
+        # Get the missing cards of each Show with a media directory
+        shows = [show for show in self.shows if show.media_directory]
+        title_cards = [
+            title_card
+            for show in shows
+            for title_card in show._get_missing_title_cards()
+        ]
+
+        # Create all cards, then update record keeper for each Show
+        Show._create_title_cards(title_cards, f'archive of {self}')
+        for show in shows:
+            global_objects.show_record_keeper.add_config(show)
+
+
     def create_summary(self) -> None:
         """Create the Summary image for each archive in this object."""
 
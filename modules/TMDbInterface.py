@@ -1,20 +1,29 @@
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from json import JSONDecodeError, loads
 from pathlib import Path
-from tinydb import Query, where
+from sqlite3 import connect, Connection, DatabaseError
+from threading import Lock, RLock
+from time import monotonic, sleep, time
 from typing import Any, Callable, Iterable, Optional
 
+from requests import Response
 from tmdbapis import TMDbAPIs, NotFound, Unauthorized, TMDbException
-from tmdbapis.objs.reload import Episode as TMDbEpisode
+from tmdbapis.objs.reload import (
+    Episode as TMDbEpisode, Season as TMDbSeason, TVShow as TMDbSeries
+)
 from tmdbapis.objs.image import Still as TMDbStill
 
 from modules.Debug import log
 from modules.EpisodeDataSource import EpisodeDataSource
 from modules.EpisodeInfo import EpisodeInfo
 import modules.global_objects as global_objects
-from modules.PersistentDatabase import PersistentDatabase
 from modules.SeriesInfo import SeriesInfo
 from modules.WebInterface import WebInterface
 
+BlacklistKey = tuple[str, str, int, int]
+EpisodeKey = tuple[str, int, int, bool]
+
 class TMDbInterface(EpisodeDataSource, WebInterface):
     """
     This class defines an interface to TheMovieDatabase (TMDb). Once
@@ -26,6 +35,15 @@ class TMDbInterface(EpisodeDataSource, WebInterface):
     """Default for how many failed requests lead to a blacklisted entry"""
     BLACKLIST_THRESHOLD = 5
 
+    """Maximum number of HTTP requests to make to TMDb each second"""
+    REQUESTS_PER_SECOND = 40
+
+    """How many source image lookups to make at once"""
+    MAX_CONCURRENT_REQUESTS = 8
+
+    """How long (in seconds) to not re-query episodes not found on TMDb"""
+    MISSING_EPISODE_RETRY_DELAY = 5 * 60
+
     """Series ID's that can be set by TMDb"""
     SERIES_IDS = ('imdb_id', 'tmdb_id', 'tvdb_id', 'tvrage_id')
 
@@ -89,9 +107,35 @@ class TMDbInterface(EpisodeDataSource, WebInterface):
         'zh': r'第 {number} 集',
     }
 
+    """Text before and after the number of each generic title format"""
+    __GENERIC_TITLE_AFFIXES = {
+        code: tuple(title_format.split('{number}', 1))
+        for code, title_format in GENERIC_TITLE_FORMATS.items()
+    }
+
     """Filename for where to store blacklisted entries"""
-    __BLACKLIST_DB = 'tmdb_blacklist.json'
+    __BLACKLIST_DB = 'tmdb_blacklist.db'
 
+    """Filename of the TinyDB blacklist used by previous versions"""
+    __LEGACY_BLACKLIST_DB = 'tmdb_blacklist.json'
+
+    """
+    Schema of the blacklist database. The write-ahead log makes each
+    write an append to the log, rather than a rewrite of the database
+    """
+    __BLACKLIST_SCHEMA = (
+        'PRAGMA journal_mode=WAL;'
+        'PRAGMA synchronous=NORMAL;'
+        'CREATE TABLE IF NOT EXISTS blacklist ('
+            'series TEXT NOT NULL, '
+            'query TEXT NOT NULL, '
+            'season INTEGER NOT NULL, '
+            'episode INTEGER NOT NULL, '
+            'failures INTEGER NOT NULL, '
+            'next REAL NOT NULL, '
+            'PRIMARY KEY (series, query, season, episode)'
+        ');'
+    )
 
     def __init__(self, api_key: str) -> None:
         """
@@ -107,8 +151,37 @@ class TMDbInterface(EpisodeDataSource, WebInterface):
         self.preferences = global_objects.pp
         self.info_set = global_objects.info_set
 
-        # Create/read blacklist database
-        self.__blacklist = PersistentDatabase(self.__BLACKLIST_DB)
+        # Blacklist database is connected on first use, guarded for concurrent
+        # requests
+        self.__blacklist_connection: Optional[Connection] = None
+        self.__blacklist_lock = RLock()
+
+        # Earliest time the next rate-limited request can be made
+        self.__next_request = monotonic()
+        self.__rate_limit_lock = Lock()
+
+        # Keys of permanently blacklisted requests, read on first use and
+        # re-read whenever another connection modifies the blacklist
+        self.__permanent_blacklist_keys: Optional[set[BlacklistKey]] = None
+        self.__permanent_blacklist_version: Optional[int] = None
+
+        # Series returned by TMDb, keyed by TMDb ID
+        self.__series: dict[int, TMDbSeries] = {}
+
+        # Episodes found on TMDb, keyed by series, index, and title matching
+        self.__episodes: dict[EpisodeKey, TMDbEpisode] = {}
+
+        # Earliest time episodes not found on TMDb can be queried again
+        self.__missing_episodes: dict[EpisodeKey, float] = {}
+
+        # Series TMDb ID and season number of seasons whose episodes are loaded
+        self.__loaded_seasons: set[tuple[int, int]] = set()
+
+        # Parse all responses given to tmdbapis with the faster JSON decoder
+        self.session.hooks['response'].append(self._fast_json_hook)
+
+        # Space out every request made to TMDb (by any thread)
+        self.session.hooks['response'].append(self.__rate_limit_hook)
 
         # Create API object, validate key
         try:
@@ -156,13 +229,121 @@ class TMDbInterface(EpisodeDataSource, WebInterface):
         return decorator
 
 
-    def __get_condition(self,
+    @staticmethod
+    def __connect_blacklist() -> Connection:
+        """
+        Connect to the blacklist database, creating the blacklist table
+        if it does not exist. If the database is corrupted, then it is
+        deleted and recreated.
+
+        Returns:
+            Connection to the blacklist database.
+        """
+
+        file = global_objects.pp.database_directory/TMDbInterface.__BLACKLIST_DB
+        file.parent.mkdir(exist_ok=True, parents=True)
+
+        try:
+            connection = connect(file, check_same_thread=False)
+            connection.executescript(TMDbInterface.__BLACKLIST_SCHEMA)
+        except DatabaseError as e:
+            log.exception(f'Database {file.resolve()} is corrupted', e)
+            file.unlink(missing_ok=True)
+            connection = connect(file, check_same_thread=False)
+            connection.executescript(TMDbInterface.__BLACKLIST_SCHEMA)
+
+        TMDbInterface.__migrate_legacy_blacklist(connection)
+
+        return connection
+
+
+    @staticmethod
+    def __migrate_legacy_blacklist(connection: Connection) -> None:
+        """
+        Migrate the entries of the TinyDB blacklist used by previous
+        versions into the given blacklist database, and then delete the
+        legacy file.
+
+        Args:
+            connection: Connection to the blacklist database to migrate
+                entries into.
+        """
+
+        file = global_objects.pp.database_directory \
+            / TMDbInterface.__LEGACY_BLACKLIST_DB
+        if not file.exists():
+            return None
+
+        # Entries are stored by document ID under the default TinyDB table
+        try:
+            entries = [
+                (entry['series'], entry['query'], entry.get('season', -1),
+                 entry.get('episode', -1), entry['failures'], entry['next'])
+                for entry in loads(file.read_text()).get('_default',{}).values()
+            ]
+            connection.executemany(
+                'INSERT OR IGNORE INTO blacklist VALUES (?, ?, ?, ?, ?, ?)',
+                entries
+            )
+            connection.commit()
+            log.info(f'Migrated {len(entries)} entries from legacy blacklist '
+                     f'"{file.resolve()}"')
+        except (JSONDecodeError, AttributeError, KeyError, TypeError) as e:
+            log.exception(f'Cannot migrate legacy blacklist '
+                          f'"{file.resolve()}"', e)
+
+        file.unlink(missing_ok=True)
+
+
+    @property
+    def __blacklist(self) -> Connection:
+        """
+        Connection to the blacklist database. The database is only
+        connected to (and any legacy blacklist migrated) when first
+        accessed.
+        """
+
+        with self.__blacklist_lock:
+            if self.__blacklist_connection is None:
+                self.__blacklist_connection = self.__connect_blacklist()
+
+            return self.__blacklist_connection
+
+
+    @property
+    def __permanent_blacklist(self) -> set[BlacklistKey]:
+        """
+        Keys of all permanently blacklisted requests, for quick
+        membership checks. These are only read from the blacklist
+        database when first accessed, or after the database is modified
+        by another connection (e.g. by unblacklist()).
+        """
+
+        with self.__blacklist_lock:
+            version, = self.__blacklist.execute(
+                'PRAGMA data_version'
+            ).fetchone()
+            if (self.__permanent_blacklist_keys is None
+                or version != self.__permanent_blacklist_version):
+                self.__permanent_blacklist_version = version
+                self.__permanent_blacklist_keys = set(
+                    self.__blacklist.execute(
+                        'SELECT series, query, season, episode FROM blacklist '
+                        'WHERE failures > ?',
+                        (self.preferences.tmdb_retry_count,)
+                    )
+                )
+
+            return self.__permanent_blacklist_keys
+
+
+    def __get_key(self,
             query_type: str,
             series_info: SeriesInfo,
             episode_info: Optional[EpisodeInfo] = None
-        ) -> Query:
+        ) -> BlacklistKey:
         """
-        Get the tinydb query condition for the given query.
+        Get the blacklist key for the given query.
 
         Args:
             query_type: The type of request being updated.
@@ -170,26 +351,41 @@ class TMDbInterface(EpisodeDataSource, WebInterface):
             episode_info: EpisodeInfo for the request.
 
         Returns:
-            The condition that matches the given query type, series, and
-            Episode season + episode number and episode.
+            The key that identifies the given series, query type, and
+            Episode season + episode number.
         """
 
         # Logo and backdrop queries don't use episode index
         if query_type in ('logo', 'backdrop'):
-            return (
-                (where('query') == query_type) &
-                (where('series') == series_info.full_name)
-            )
+            return series_info.full_name, query_type, -1, -1
 
         # Query by series name and episode index
         return (
-            (where('query') == query_type) &
-            (where('series') == series_info.full_name) &
-            (where('season') == episode_info.season_number) &
-            (where('episode') == episode_info.episode_number)
+            series_info.full_name, query_type,
+            episode_info.season_number, episode_info.episode_number,
         )
 
 
+    def __get_entry(self, key: BlacklistKey) -> Optional[tuple[int, float]]:
+        """
+        Get the blacklist entry for the given request.
+
+        Args:
+            key: Blacklist key of the request being checked.
+
+        Returns:
+            Tuple of the failure count and the timestamp of the next
+            allowed query for this request. None if the request is not
+            in the blacklist.
+        """
+
+        with self.__blacklist_lock:
+            return self.__blacklist.execute(
+                'SELECT failures, next FROM blacklist '
+                'WHERE series=? AND query=? AND season=? AND episode=?', key
+            ).fetchone()
+
+
     def __update_blacklist(self,
             series_info: SeriesInfo,
             episode_info: Optional[EpisodeInfo],
@@ -205,37 +401,26 @@ class TMDbInterface(EpisodeDataSource, WebInterface):
             query_type: The type of request being updated.
         """
 
-        # Get the entry for this request
-        condition = self.__get_condition(query_type, series_info, episode_info)
-        entry = self.__blacklist.get(condition)
-
-        # If previously indexed and next has passed, increase count and set next
-        later = (datetime.now() + timedelta(hours=12)).timestamp()
+        # Next query for this request is allowed in 12 hours
+        now = time()
+        later = now + timedelta(hours=12).total_seconds()
+
+        # Insert new entry, or increment an existing entry if next has passed
+        key = self.__get_key(query_type, series_info, episode_info)
+        with self.__blacklist_lock:
+            self.__blacklist.execute(
+                'INSERT INTO blacklist VALUES (?, ?, ?, ?, 1, ?) '
+                'ON CONFLICT(series, query, season, episode) DO UPDATE SET '
+                    'failures=failures+1, next=excluded.next '
+                'WHERE next <= ?',
+                (*key, later, now)
+            )
+            self.__blacklist.commit()
+            failures, _ = self.__get_entry(key)
 
-        # If this entry exists, check that next has passed
-        if entry is not None:
-            if datetime.now().timestamp() >= entry['next']:
-                self.__blacklist.upsert(
-                    {'failures': entry['failures']+1, 'next': later},
-                    condition
-                )
-        else:
-            if query_type in ('logo', 'backdrop'):
-                self.__blacklist.upsert({
-                    'query': query_type,
-                    'series': series_info.full_name,
-                    'failures': 1,
-                    'next': later,    
-                }, condition)
-            else:
-                self.__blacklist.upsert({
-                    'query': query_type,
-                    'series': series_info.full_name,
-                    'season': episode_info.season_number,
-                    'episode': episode_info.episode_number,
-                    'failures': 1,
-                    'next': later,
-                }, condition)
+        # Track this request if it has now been permanently blacklisted
+        if failures > self.preferences.tmdb_retry_count:
+            self.__permanent_blacklist.add(key)
 
 
     def __is_blacklisted(self,
@@ -255,21 +440,20 @@ class TMDbInterface(EpisodeDataSource, WebInterface):
             True if the entry is blacklisted, False otherwise.
         """
 
+        # If too many failures, blacklisted
+        key = self.__get_key(query_type, series_info, episode_info)
+        if key in self.__permanent_blacklist:
+            return True
+
         # Get the blacklist entry for this request
-        entry = self.__blacklist.get(
-            self.__get_condition(query_type, series_info, episode_info)
-        )
+        entry = self.__get_entry(key)
 
         # If request DNE, not blacklisted
         if entry is None:
             return False
 
-        # If too many failures, blacklisted
-        if entry['failures'] > self.preferences.tmdb_retry_count:
-            return True
-
         # If next hasn't passed, treat as temporary blacklist
-        return datetime.now().timestamp() < entry['next']
+        return time() < entry[1]
 
 
     def is_permanently_blacklisted(self,
@@ -287,17 +471,51 @@ class TMDbInterface(EpisodeDataSource, WebInterface):
             True if permanently blacklisted, False otherwise.
         """
 
-        # Get the blacklist entry for this request
-        entry = self.__blacklist.get(
-            self.__get_condition(query_type, series_info, episode_info)
-        )
+        key = self.__get_key(query_type, series_info, episode_info)
 
-        # If request hasn't been blacklisted, not blacklisted
-        if entry is None:
-            return False
+        return key in self.__permanent_blacklist
 
-        # If too many failures, blacklisted
-        return entry['failures'] > self.preferences.tmdb_retry_count
+
+    def __get_series(self, tmdb_id: int) -> TMDbSeries:
+        """
+        Get the series with the given TMDb ID. Series are only queried
+        once per ID, after which the previously returned series is used.
+
+        Args:
+            tmdb_id: TMDb ID of the series to get.
+
+        Returns:
+            The series with the given ID.
+
+        Raises:
+            NotFound if the series does not exist on TMDb.
+        """
+
+        if (series := self.__series.get(tmdb_id)) is None:
+            series = self.__series[tmdb_id] = self.api.tv_show(tmdb_id)
+
+        return series
+
+
+    def __load_season(self, tmdb_id: int, season: TMDbSeason) -> TMDbSeason:
+        """
+        Load the episodes of the given season of a series. Seasons are
+        only loaded once, after which the already loaded season is used.
+
+        Args:
+            tmdb_id: TMDb ID of the series the season belongs to.
+            season: The season to load.
+
+        Returns:
+            The loaded season.
+        """
+
+        key = tmdb_id, season.season_number
+        if key not in self.__loaded_seasons:
+            season.reload()
+            self.__loaded_seasons.add(key)
+
+        return season
 
 
     @catch_and_log('Error setting series ID')
@@ -317,7 +535,7 @@ class TMDbInterface(EpisodeDataSource, WebInterface):
         found = False
         if not found and series_info.has_id('tmdb_id'):
             try:
-                results = [self.api.tv_show(series_info.tmdb_id)]
+                results = [self.__get_series(series_info.tmdb_id)]
                 found = True
             except NotFound:
                 pass
@@ -399,7 +617,7 @@ class TMDbInterface(EpisodeDataSource, WebInterface):
 
         # Get all seasons on TMDb
         try:
-            seasons = self.api.tv_show(series_info.tmdb_id).seasons
+            seasons = self.__get_series(series_info.tmdb_id).seasons
         except NotFound:
             log.error(f'Cannot source episodes from TMDb for {series_info}')
             return []
@@ -408,7 +626,7 @@ class TMDbInterface(EpisodeDataSource, WebInterface):
         all_episodes = []
         for season in seasons:
             # Load episodes, now iterate through them
-            season.reload()
+            self.__load_season(series_info.tmdb_id, season)
             for episode in season.episodes:
                 # Skip episodes until they've aired
                 if (episode.air_date is not None
@@ -461,6 +679,48 @@ class TMDbInterface(EpisodeDataSource, WebInterface):
             title_match: bool = True
         ) -> Optional[TMDbEpisode]:
         """
+        Find the given episode on TMDb. Once found, an episode is not
+        queried again for the same series, index, and title matching;
+        instead the previously found episode is used. Episodes that are
+        not found are not queried again for MISSING_EPISODE_RETRY_DELAY
+        seconds.
+
+        Args:
+            series_info: The series information.
+            episode_info: The episode information.
+            title_match: Whether to require the title within
+                episode_info to match the title on TMDb.
+
+        Returns:
+            The found episode (or movie). None if the entry cannot be
+            found.
+        """
+
+        key = (series_info.full_name, episode_info.season_number,
+               episode_info.episode_number, title_match)
+        if (episode := self.__episodes.get(key)) is not None:
+            return episode
+
+        # Skip episodes that were recently not found
+        if monotonic() < self.__missing_episodes.get(key, 0):
+            return None
+
+        episode = self.__query_episode(series_info, episode_info, title_match)
+        if episode is None:
+            self.__missing_episodes[key] = (monotonic()
+                                            + self.MISSING_EPISODE_RETRY_DELAY)
+        else:
+            self.__episodes[key] = episode
+
+        return episode
+
+
+    def __query_episode(self,
+            series_info: SeriesInfo,
+            episode_info: EpisodeInfo,
+            title_match: bool = True
+        ) -> Optional[TMDbEpisode]:
+        """
         Finds the episode index for the given entry. Searching is done
         in the following priority:
 
@@ -564,16 +824,16 @@ class TMDbInterface(EpisodeDataSource, WebInterface):
 
         # Verify series ID is valid
         try:
-            series = self.api.tv_show(series_info.tmdb_id)
+            series = self.__get_series(series_info.tmdb_id)
         except (NotFound, TMDbException):
             return None
 
         def _match_by_index(episode_info, season_number, episode_number):
-            # Find episode with series TMDb ID and given index
+            # Find episode with series TMDb ID and given index, this is loaded
+            # in full upon creation
             try:
                 episode = self.api.tv_episode(series_info.tmdb_id,
                                               season_number, episode_number)
-                episode.reload()
             except (NotFound, TMDbException):
                 return None
 
@@ -587,7 +847,6 @@ class TMDbInterface(EpisodeDataSource, WebInterface):
         # Try and match by index
         indices = episode_info.season_number, episode_info.episode_number
         if (episode := _match_by_index(episode_info, *indices)) is not None:
-            episode.reload()
             return episode
 
         # Match by absolute number
@@ -595,14 +854,14 @@ class TMDbInterface(EpisodeDataSource, WebInterface):
             # Try for this season
             indices = episode_info.season_number, episode_info.abs_number
             if (ep := _match_by_index(episode_info, *indices)) is not None:
-                ep.reload()
                 return ep
 
-            # Try for all seasons
+            # Try for all other seasons
             for season in series.seasons:
+                if season.season_number == episode_info.season_number:
+                    continue
                 indices = season.season_number, episode_info.abs_number
                 if (ep := _match_by_index(episode_info, *indices)) is not None:
-                    ep.reload()
                     return ep
 
         # If title match is disabled, cannot identify
@@ -611,7 +870,7 @@ class TMDbInterface(EpisodeDataSource, WebInterface):
 
         # Try every episode
         for season in series.seasons:
-            season.reload()
+            self.__load_season(series_info.tmdb_id, season)
             for episode in season.episodes:
                 if ((episode_info.has_id('tmdb_id') and
                     episode_info.tmdb_id == episode.id)
@@ -663,31 +922,21 @@ class TMDbInterface(EpisodeDataSource, WebInterface):
             there are no valid images.
         """
 
-        # Pick the best image based on image dimensions, and then vote average
-        best_image = {'index': 0, 'pixels': 0, 'score': 0}
-        valid_image = False
-        for index, image in enumerate(images):
-            # Get image dimensions
-            width, height = image.width, image.height
-
-            # If source image selection, check dimensions and localization
-            if is_source_image:
-                if not self.preferences.meets_minimum_resolution(width, height):
-                    continue
-                if skip_localized and image.iso_639_1 is not None:
-                    continue
-
-            # If the image has valid dimensions,get pixel count and vote average
-            valid_image = True
-            pixels = height * width
-            score = image.vote_average
-
-            # Priority 1 is image size, priority 2 is vote average/score
-            if (pixels > best_image['pixels'] or (pixels == best_image['pixels']
-                and score > best_image['score'])):
-                best_image = {'index': index, 'pixels': pixels, 'score': score}
+        # If source image selection, filter by dimensions and localization
+        if is_source_image:
+            meets_resolution = self.preferences.meets_minimum_resolution
+            images = (
+                image for image in images
+                if meets_resolution(image.width, image.height)
+                and not (skip_localized and image.iso_639_1 is not None)
+            )
 
-        return images[best_image['index']] if valid_image else None
+        # Priority 1 is image size, priority 2 is vote average/score
+        return max(
+            images,
+            key=lambda image: (image.width * image.height, image.vote_average),
+            default=None,
+        )
 
 
     @catch_and_log('Error getting source image', default=None)
@@ -747,6 +996,73 @@ class TMDbInterface(EpisodeDataSource, WebInterface):
         return None
 
 
+    def __wait_for_rate_limit(self) -> None:
+        """
+        Block until another request can be made without exceeding
+        REQUESTS_PER_SECOND.
+        """
+
+        with self.__rate_limit_lock:
+            now = monotonic()
+            wait = self.__next_request - now
+            self.__next_request = (max(now, self.__next_request)
+                                   + 1 / self.REQUESTS_PER_SECOND)
+
+        if wait > 0:
+            sleep(wait)
+
+
+    def __rate_limit_hook(self, response: Response, *args, **kwargs) -> None:
+        """
+        Response hook for the TMDb session that reserves the next
+        request slot, so the thread that made the request cannot make
+        another one until REQUESTS_PER_SECOND allows it.
+
+        Args:
+            response: Response returned by TMDb.
+            args: Any additional arguments passed by requests.
+            kwargs: Any additional keyword arguments passed by requests.
+        """
+
+        self.__wait_for_rate_limit()
+
+
+    def get_source_images(self,
+            series_info: SeriesInfo,
+            episode_infos: Iterable[EpisodeInfo], *,
+            title_match: bool = True,
+            skip_localized_images: bool = False) -> list[Optional[str]]:
+        """
+        Get the best source image for each of the given episodes. The
+        lookups for each episode are made concurrently; every request
+        is still subject to REQUESTS_PER_SECOND.
+
+        Args:
+            series_info: SeriesInfo for all episodes.
+            episode_infos: EpisodeInfo for each episode to get the
+                source image of.
+            title_match:  (Keyword only) Whether to require the episode
+                title to match when querying TMDb.
+            skip_localized_images: (Keyword only) Whether to skip images
+                with a non-null language code - i.e. skipping localized
+                images.
+
+        Returns:
+            List of the URL to the 'best' source image for each episode,
+            in the order of the given EpisodeInfo objects. Entries are
+            None if no images are available.
+        """
+
+        def _get_source_image(episode_info: EpisodeInfo) -> Optional[str]:
+            return self.get_source_image(
+                series_info, episode_info, title_match=title_match,
+                skip_localized_images=skip_localized_images,
+            )
+
+        with ThreadPoolExecutor(self.MAX_CONCURRENT_REQUESTS) as executor:
+            return list(executor.map(_get_source_image, episode_infos))
+
+
     def __is_generic_title(self,
             title: str,
             language_code: str,
@@ -770,20 +1086,24 @@ class TMDbInterface(EpisodeDataSource, WebInterface):
             code = language_code.split('-')[0]
 
         # Assume non-generic if the code isn't pre-mapped
-        if not (generic := self.GENERIC_TITLE_FORMATS.get(code, None)):
+        if not (affixes := self.__GENERIC_TITLE_AFFIXES.get(code, None)):
             log.debug(f'Unrecognized language code "{language_code}"')
             return False
 
-        # Format with this episode, return whether this matches the translation
+        # Title must be the generic text surrounding some number
+        prefix, suffix = affixes
+        if not (title.startswith(prefix) and title.endswith(suffix)):
+            return False
+        number = title[len(prefix):len(title)-len(suffix)]
+
+        # Check against episode and absolute number (if present)
         if episode_info.abs_number is not None:
-            # Check against episode and absolute number
-            return title in (
-                generic.format(number=episode_info.episode_number),
-                generic.format(number=episode_info.abs_number),
+            return number in (
+                str(episode_info.episode_number), str(episode_info.abs_number)
             )
 
         # Only check against episode number (no absolute)
-        return title == generic.format(number=episode_info.episode_number)
+        return number == str(episode_info.episode_number)
 
 
     @catch_and_log('Error getting episode title', default=None)
@@ -858,7 +1178,7 @@ class TMDbInterface(EpisodeDataSource, WebInterface):
 
         # Get the series for this logo, exit if series or logos DNE
         try:
-            series = self.api.tv_show(series_info.tmdb_id)
+            series = self.__get_series(series_info.tmdb_id)
         except NotFound:
             self.__update_blacklist(series_info, None, 'logo')
             return None
@@ -868,36 +1188,18 @@ class TMDbInterface(EpisodeDataSource, WebInterface):
             self.__update_blacklist(series_info, None, 'logo')
             return None
 
-        # Get the best logo
-        best, best_priority = None, 999
-        for logo in series.logos:
-            # Skip logos with unindicated languages
-            if (logo.iso_639_1
-                not in self.preferences.tmdb_logo_language_priority):
-                continue
-            # Get relative priority of this logo's language
-            priority = self.preferences.tmdb_logo_language_priority.index(
-                logo.iso_639_1
-            )
-
-            # Skip this logo if the language priority is less than the current
-            # best. Highest priority is index 0, so use > for lower priority
-            if priority > best_priority:
-                continue
-            # New logo is higher priority, use always
-            elif priority < best_priority:
-                best = logo
-                best_priority = priority
-            # Same priority, compare sizes
-            elif priority == best_priority:
-                # SVG logos are infinite size
-                if logo.url.endswith('.svg') and not best.url.endswith('.svg'):
-                    best = logo
-                    best_priority = priority
-                elif (best is None
-                    or logo.width * logo.height > best.width * best.height):
-                    best = logo
-                    best_priority = priority
+        # Get the best logo of the indicated languages. Highest priority is
+        # index 0, then prefer SVG logos (infinite size), then the largest
+        priority = self.preferences.tmdb_logo_language_priority
+        best = min(
+            (logo for logo in series.logos if logo.iso_639_1 in priority),
+            key=lambda logo: (
+                priority.index(logo.iso_639_1),
+                not logo.url.endswith('.svg'),
+                -logo.width * logo.height,
+            ),
+            default=None,
+        )
 
         # No valid image found, blacklist and exit
         if best is None:
@@ -930,7 +1232,7 @@ class TMDbInterface(EpisodeDataSource, WebInterface):
 
         # Get the series for this backdrop, exit if series or backdrop DNE
         try:
-            series = self.api.tv_show(series_info.tmdb_id)
+            series = self.__get_series(series_info.tmdb_id)
         except NotFound:
             self.__update_blacklist(series_info, None, 'backdrop')
             return None
@@ -977,24 +1279,58 @@ class TMDbInterface(EpisodeDataSource, WebInterface):
         self.set_series_ids(si)
 
         # Go through each episode in the given range
+        episode_infos, destinations = [], []
         for episode_number in episode_range:
-            ei = EpisodeInfo('', season_number, episode_number)
-            image_url = self.get_source_image(si, ei, title_match=False)
+            # Skip episodes whose image was already downloaded
+            destination = directory / f's{season_number}e{episode_number}.jpg'
+            if destination.exists() and destination.stat().st_size > 0:
+                log.debug(f'{destination.resolve()} already exists, skipping')
+                continue
 
-            # If a valid URL was returned, download it
+            episode_infos.append(EpisodeInfo('', season_number, episode_number))
+            destinations.append(destination)
+
+        # Get all source images at once
+        image_urls = self.get_source_images(si, episode_infos,title_match=False)
+
+        # If a valid URL was returned, download it
+        def _download(image_url: Optional[str], destination: Path) -> None:
             if image_url is not None:
-                filename = f's{season_number}e{episode_number}.jpg'
-                if self.download_image(image_url, directory / filename):
-                    log.debug(f'Downloaded {(directory / filename).resolve()}')
+                if self.download_image(image_url, destination):
+                    log.debug(f'Downloaded {destination.resolve()}')
+
+        with ThreadPoolExecutor(self.MAX_CONCURRENT_REQUESTS) as executor:
+            list(executor.map(_download, image_urls, destinations))
+
+
+    def close(self) -> None:
+        """
+        Close the connection to the blacklist database (if open), so
+        its write-ahead log is checkpointed and removed. The database
+        is reconnected to if the blacklist is accessed again.
+        """
+
+        with self.__blacklist_lock:
+            if self.__blacklist_connection is not None:
+                self.__blacklist_connection.close()
+                self.__blacklist_connection = None
+                self.__permanent_blacklist_keys = None
 
 
     @staticmethod
     def unblacklist(series_info: SeriesInfo) -> None:
-        """Remove all blacklist entries for the given series."""
+        """
+        Remove all blacklist entries for the given series. Any existing
+        TMDbInterface re-reads its permanent blacklist on next access.
+        """
 
-        blacklist = PersistentDatabase(TMDbInterface.__BLACKLIST_DB)
-        removed = blacklist.remove(where('series') == series_info.full_name)
-        log.info(f'Unblacklisted {len(removed)} queries')
+        blacklist = TMDbInterface.__connect_blacklist()
+        removed = blacklist.execute(
+            'DELETE FROM blacklist WHERE series=?', (series_info.full_name,)
+        ).rowcount
+        blacklist.commit()
+        blacklist.close()
+        log.info(f'Unblacklisted {removed} queries')
 
 
     @staticmethod
@@ -1003,4 +1339,8 @@ class TMDbInterface(EpisodeDataSource, WebInterface):
 
         database = database_directory / TMDbInterface.__BLACKLIST_DB
         database.unlink(missing_ok=True)
+
+        # Delete the write-ahead log and shared memory files
+        for suffix in ('-wal', '-shm'):
+            Path(f'{database}{suffix}').unlink(missing_ok=True)
         log.info(f'Deleted blacklist file "{database.resolve()}"')
\ No newline at end of file
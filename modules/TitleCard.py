@@ -50,6 +50,12 @@ class TitleCard:
     DEFAULT_HEIGHT = BaseCardType.HEIGHT
     DEFAULT_CARD_DIMENSIONS = BaseCardType.TITLE_CARD_SIZE
 
+    """
+    Default number of title cards to create at once - ImageMagick already
+    uses multiple threads for each card
+    """
+    DEFAULT_CARD_CONCURRENCY = 2
+
     """Mapping of card type identifiers to CardType classes"""
     DEFAULT_CARD_TYPE = 'standard'
     CARD_TYPES = {
@@ -298,7 +304,8 @@ class TitleCard:
             return False
 
         # Create parent folders if necessary for this card
-        self.file.parent.mkdir(parents=True, exist_ok=True)
+        if not self.file.parent.exists():
+            self.file.parent.mkdir(parents=True, exist_ok=True)
 
         # Create card
         try:
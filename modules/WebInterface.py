@@ -1,13 +1,22 @@
+import os
 from pathlib import Path
 from re import IGNORECASE, compile as re_compile
-from requests import get, Session
+from requests import Response, Session
+from requests.adapters import HTTPAdapter
 from typing import Any, Union
 import urllib3
+from urllib3.util.retry import Retry
 
 from tenacity import retry, stop_after_attempt, wait_fixed, wait_exponential
 
 from modules.Debug import log
 
+# Use orjson to parse responses if available, otherwise the standard library
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 class WebInterface:
     """
     This class defines a WebInterface, which is a type of interface that
@@ -24,6 +33,17 @@ class WebInterface:
     """Regex to match URL's"""
     _URL_REGEX = re_compile(r'^((?:https?:\/\/)?.+)(?=\/)', IGNORECASE)
 
+    """Size of each chunk of a streamed image download"""
+    DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+    """Session shared by all image downloads to reuse pooled connections"""
+    _DOWNLOAD_SESSION = Session()
+    _DOWNLOAD_SESSION.mount('https://', HTTPAdapter(
+        pool_maxsize=16,
+        max_retries=Retry(total=3, backoff_factor=0.5,
+                          status_forcelist=(500, 502, 503, 504)),
+    ))
+
     """Content to ignore if returned by any GET request"""
     BAD_CONTENT = (
         b'<html><head><title>Not Found</title></head>'
@@ -52,8 +72,14 @@ class WebInterface:
         # Store name of this interface
         self.name = name
 
-        # Create session for persistent requests
+        # Create session for persistent requests, reusing pooled connections
         self.session = Session()
+        adapter = HTTPAdapter(
+            pool_maxsize=16,
+            max_retries=Retry(total=3, backoff_factor=0.3),
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
 
         # Whether to verify SSL
         self.session.verify = verify_ssl
@@ -63,8 +89,7 @@ class WebInterface:
 
         # Cache of the last requests to speed up identical sequential requests
         self.__do_cache = cache
-        self.__cache = []
-        self.__cached_results = []
+        self.__cache: dict[tuple[str, str], dict[str, Any]] = {}
 
 
     def __repr__(self) -> str:
@@ -73,6 +98,27 @@ class WebInterface:
         return f'<WebInterface to {self.name}>'
 
 
+    @staticmethod
+    def _fast_json_hook(response: Response, *args, **kwargs) -> Response:
+        """
+        Response hook that makes the json() method of the given response
+        parse its content with the fastest available JSON decoder. This
+        is for sessions whose responses are parsed by other libraries.
+
+        Args:
+            response: Response to modify.
+            args: Any additional arguments passed by requests.
+            kwargs: Any additional keyword arguments passed by requests.
+
+        Returns:
+            The modified response.
+        """
+
+        response.json = lambda **_: json_loads(response.content)
+
+        return response
+
+
     @retry(stop=stop_after_attempt(5),
            wait=wait_fixed(5)+wait_exponential(min=1, max=16),
            before_sleep=lambda _:log.warning('Failed to submit GET request, retrying..'))
@@ -88,11 +134,11 @@ class WebInterface:
             Dict made from the JSON return of the specified GET request.
         """
 
-        return self.session.get(
+        return json_loads(self.session.get(
             url=url,
             params=params,
             timeout=self.REQUEST_TIMEOUT
-        ).json()
+        ).content)
 
 
     def _get(self, url: str, params: dict[str, Any]) -> dict[str, Any]:
@@ -114,23 +160,20 @@ class WebInterface:
         if not self.__do_cache:
             return self.__retry_get(url=url, params=params)
 
-        # Look through all cached results for this exact URL+params; if found,
-        # skip the request and return that result
-        for cache, result in zip(self.__cache, self.__cached_results):
-            if cache['url'] == url and cache['params'] == str(params):
-                return result
+        # If this exact URL+params is cached, skip the request and return that
+        # result
+        key = url, str(params)
+        if key in self.__cache:
+            return self.__cache[key]
 
         # Make new request, add to cache
-        self.__cached_results.append(self.__retry_get(url=url, params=params))
-        self.__cache.append({'url': url, 'params': str(params)})
+        result = self.__cache[key] = self.__retry_get(url=url, params=params)
 
-        # Delete element from cache if length has been exceeded
+        # Delete oldest element from cache if length has been exceeded
         if len(self.__cache) > self.CACHE_LENGTH:
-            self.__cache.pop(0)
-            self.__cached_results.pop(0)
+            del self.__cache[next(iter(self.__cache))]
 
-        # Return latest result
-        return self.__cached_results[-1]
+        return result
 
 
     @staticmethod
@@ -157,16 +200,41 @@ class WebInterface:
 
         # Attempt to download the image, if an error happens log to user
         try:
-            # Get content from URL
+            # Stream content from URL
             error = lambda s: f'URL {image} returned {s} content'
-            image = get(image).content
-            if len(image) == 0:
-                raise Exception(error('no'))
-            if any(bad_content in image for bad_content in WebInterface.BAD_CONTENT):
-                raise Exception(error('bad (malformed)'))
-
-            # Write content to file, return success
-            destination.write_bytes(image)
+            with WebInterface._DOWNLOAD_SESSION.get(
+                    image, stream=True,
+                    timeout=WebInterface.REQUEST_TIMEOUT) as response:
+                response.raise_for_status()
+
+                # Bad content is a short page, so only check the first chunk
+                chunks = response.iter_content(WebInterface.DOWNLOAD_CHUNK_SIZE)
+                first_chunk = next(chunks, b'')
+                if len(first_chunk) == 0:
+                    raise Exception(error('no'))
+                if any(bad_content in first_chunk
+                       for bad_content in WebInterface.BAD_CONTENT):
+                    raise Exception(error('bad (malformed)'))
+
+                # Write content to file as it is received, return success
+                try:
+                    # Chunks are already buffered, so write them unbuffered
+                    with destination.open('wb', buffering=0) as file_handle:
+                        # Reserve space for the whole image up front if known
+                        size = int(response.headers.get('Content-Length', 0))
+                        if size > 0 and hasattr(os, 'posix_fallocate'):
+                            os.posix_fallocate(file_handle.fileno(), 0, size)
+
+                        file_handle.write(first_chunk)
+                        for chunk in chunks:
+                            file_handle.write(chunk)
+
+                        # Drop any reserved space beyond the received content
+                        file_handle.truncate()
+                except Exception:
+                    # Do not leave a partially downloaded image behind
+                    destination.unlink(missing_ok=True)
+                    raise
             return True
         except Exception as e:
             log.exception(f'Cannot download image, returned error', e)
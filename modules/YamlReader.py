@@ -1,7 +1,11 @@
 from pathlib import Path
 from typing import Any, Callable, Optional
 
-from yaml import safe_load
+from yaml import load
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
 
 from modules.Debug import log
 from modules.RemoteCardType import RemoteCardType
@@ -172,7 +176,7 @@ class YamlReader:
         # Open file and return contents
         with file.open('r', encoding='utf-8') as file_handle:
             try:
-                return safe_load(file_handle)
+                return load(file_handle, Loader=SafeLoader)
             except Exception as e:
                 # Log error, if critical then exit with error code
                 if critical:
@@ -70,13 +70,13 @@ class AnimeTitleCard(BaseCardType):
     USES_SEASON_TITLE = True
 
     """Source path for the gradient image overlayed over all title cards"""
-    __GRADIENT_IMAGE: Path = REF_DIRECTORY / 'GRADIENT.png'
+    __GRADIENT_IMAGE = str((REF_DIRECTORY / 'GRADIENT.png').resolve())
 
     """Path to the font to use for the kanji font"""
-    KANJI_FONT = REF_DIRECTORY / 'hiragino-mincho-w3.ttc'
+    KANJI_FONT = str((REF_DIRECTORY / 'hiragino-mincho-w3.ttc').resolve())
 
     """Font characteristics for the series count text"""
-    SERIES_COUNT_FONT = REF_DIRECTORY / 'Avenir.ttc'
+    SERIES_COUNT_FONT = str((REF_DIRECTORY / 'Avenir.ttc').resolve())
     SERIES_COUNT_TEXT_COLOR = '#CFCFCF'
 
     __slots__ = (
@@ -225,7 +225,7 @@ class AnimeTitleCard(BaseCardType):
         """
 
         return [
-            f'-font "{self.SERIES_COUNT_FONT.resolve()}"',
+            f'-font "{self.SERIES_COUNT_FONT}"',
             f'-kerning 2',
             f'-pointsize 67',
             f'-interword-spacing 25',
@@ -275,7 +275,7 @@ class AnimeTitleCard(BaseCardType):
                 f'-annotate +75+{base_offset} "{self.title_text}"',
                 *self.__title_text_effects,
                 f'-annotate +75+{base_offset} "{self.title_text}"',
-                f'-font "{self.KANJI_FONT.resolve()}"',
+                f'-font "{self.KANJI_FONT}"',
                 *self.__title_text_black_stroke,
                 f'-pointsize {85 * self.font_size}',
                 f'-annotate +75+{kanji_offset} "{self.kanji}"',
@@ -436,7 +436,7 @@ class AnimeTitleCard(BaseCardType):
         gradient_command = []
         if not self.omit_gradient:
             gradient_command = [
-                f'"{self.__GRADIENT_IMAGE.resolve()}"',
+                f'"{self.__GRADIENT_IMAGE}"',
                 f'-composite',
             ]
 
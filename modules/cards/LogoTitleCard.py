@@ -74,9 +74,6 @@ class LogoTitleCard(BaseCardType):
     EPISODE_COUNT_FONT = REF_DIRECTORY / 'Proxima Nova Regular.otf'
     SERIES_COUNT_TEXT_COLOR = '#CFCFCF'
 
-    """Paths to intermediate files that are deleted after the card is created"""
-    __RESIZED_LOGO = BaseCardType.TEMP_DIR / 'resized_logo.png'
-
     """Source path for the gradient image overlayed over all title cards"""
     __GRADIENT_IMAGE = REF_DIRECTORY / 'GRADIENT.png'
 
@@ -168,25 +165,29 @@ class LogoTitleCard(BaseCardType):
         self.stroke_color = stroke_color
 
 
-    def resize_logo(self) -> Path:
+    @property
+    def logo_command(self) -> ImageMagickCommands:
         """
-        Resize the logo into at most a 1875x1030 bounding box.
+        Subcommand for resizing the logo into at most a 1875x1030
+        bounding box, and adding it to the source image. The logo is
+        vertically centered within the bounding box.
 
         Returns:
-            Path to the created image.
+            List of ImageMagick commands.
         """
 
-        command = ' '.join([
-            f'convert',
-            f'"{self.logo.resolve()}"',
+        return [
+            f'\( "{self.logo.resolve()}"',
             f'-resize x1030',
             f'-resize 1875x1030\>',
-            f'"{self.__RESIZED_LOGO.resolve()}"',
-        ])
-
-        self.image_magick.run(command)
-
-        return self.__RESIZED_LOGO
+            # Pad to the bounding box so the logo is centered within it
+            f'-background transparent',
+            f'-gravity center',
+            f'-extent 1875x1030 \)',
+            f'-gravity north',
+            f'-geometry +0+60',
+            f'-composite',
+        ]
 
 
     @property
@@ -318,11 +319,6 @@ class LogoTitleCard(BaseCardType):
             log.warning(f'Source "{self.source_file.resolve()}" does not exist')
             return None
 
-        # Resize logo, get resized height to determine offset
-        resized_logo = self.resize_logo()
-        _, height = self.get_image_dimensions(resized_logo)
-        offset = 60 + ((1030 - height) // 2)
-
         # Font customizations
         vertical_shift = 245 + self.font_vertical_shift
         font_size = 157.41 * self.font_size
@@ -370,10 +366,7 @@ class LogoTitleCard(BaseCardType):
             # Add background image or color
             *background_command,
             # Overlay resized logo
-            f'"{resized_logo.resolve()}"',
-            f'-gravity north',
-            f'-geometry "+0+{offset}"',
-            f'-composite',
+            *self.logo_command,
             # Optionally overlay gradient
             *gradient_command,
             # Apply style that is applicable to entire image
@@ -400,7 +393,4 @@ class LogoTitleCard(BaseCardType):
             f'"{self.output_file.resolve()}"',
         ])
 
-        self.image_magick.run(command)
-
-        # Delete resized logo
-        self.image_magick.delete_intermediate_images(resized_logo)
\ No newline at end of file
+        self.image_magick.run(command)
\ No newline at end of file
@@ -65,7 +65,23 @@ class PosterTitleCard(BaseCardType):
     BLUR_PROFILE = '0x30'
 
     """Path to the reference star image to overlay on all source images"""
-    __GRADIENT_OVERLAY = REF_DIRECTORY / 'stars-overlay.png'
+    __GRADIENT_OVERLAY = str((REF_DIRECTORY / 'stars-overlay.png').resolve())
+
+    """Title text offset to center it in the space remaining below a logo"""
+    __LOGO_TITLE_OFFSET = (450 // 2) - (50 // 2)
+
+    """Constant ImageMagick commands preceding the episode and title text"""
+    __EPISODE_TEXT_COMMANDS = (
+        f'-gravity south',
+        f'-font "{TITLE_FONT}"',
+        f'-pointsize 75',
+        f'-fill "#FFFFFF"',
+    )
+    __TITLE_TEXT_COMMANDS = (
+        f'-gravity center',
+        f'-pointsize 165',
+        f'-interline-spacing -40',
+    )
 
     __slots__ = (
         'source_file', 'output_file', 'logo', 'title_text', 'episode_text'
@@ -180,15 +196,15 @@ class PosterTitleCard(BaseCardType):
         else:
             logo_command = [
                 f'-gravity north',
+                # Fit logo within 1775x450, scaling up or down as needed
                 f'\( "{self.logo.resolve()}"',
-                f'-resize x450',
-                f'-resize 1775x450\> \)',
+                f'-resize 1775x450 \)',
                 f'-geometry +649+50',
                 f'-composite',
             ]
 
             # Adjust title offset to center in smaller space (due to logo)
-            title_offset = (450 / 2) - (50 / 2)
+            title_offset = self.__LOGO_TITLE_OFFSET
 
         # Single command to create card
         command = ' '.join([
@@ -201,20 +217,15 @@ class PosterTitleCard(BaseCardType):
             # Apply style modifiers
             *self.style,
             # Add gradient overlay
-            f'"{self.__GRADIENT_OVERLAY.resolve()}"',
+            f'"{self.__GRADIENT_OVERLAY}"',
             f'-flatten',
             # Optionally add logo
             *logo_command,
             # Add episode text
-            f'-gravity south',
-            f'-font "{self.TITLE_FONT}"',
-            f'-pointsize 75',
-            f'-fill "#FFFFFF"',
+            *self.__EPISODE_TEXT_COMMANDS,
             f'-annotate +649+50 "{self.episode_text}"',
             # Add title text
-            f'-gravity center',                         
-            f'-pointsize 165',
-            f'-interline-spacing -40', 
+            *self.__TITLE_TEXT_COMMANDS,
             f'-annotate +649+{title_offset} "{self.title_text}"',
             # Create card
             *self.resize_output,
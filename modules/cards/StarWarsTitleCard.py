@@ -1,11 +1,7 @@
 from pathlib import Path
-from re import match
 from typing import Optional
 
-from num2words import num2words
-
 from modules.BaseCardType import BaseCardType, ImageMagickCommands
-from modules.Debug import log
 
 SeriesExtra = Optional
 
@@ -50,8 +46,10 @@ class StarWarsTitleCard(BaseCardType):
     """Characteristics of the episode text"""
     EPISODE_TEXT_FORMAT = 'EPISODE {episode_number_cardinal}'
     EPISODE_TEXT_COLOR = '#AB8630'
-    EPISODE_TEXT_FONT = REF_DIRECTORY / 'HelveticaNeue.ttc'
-    EPISODE_NUMBER_FONT = REF_DIRECTORY / 'HelveticaNeue-Bold.ttf'
+    EPISODE_TEXT_FONT = str((REF_DIRECTORY / 'HelveticaNeue.ttc').resolve())
+    EPISODE_NUMBER_FONT = str(
+        (REF_DIRECTORY / 'HelveticaNeue-Bold.ttf').resolve()
+    )
 
     """Whether this class uses season titles for the purpose of archives"""
     USES_SEASON_TITLE = False
@@ -60,7 +58,27 @@ class StarWarsTitleCard(BaseCardType):
     ARCHIVE_NAME = 'Star Wars Style'
 
     """Path to the reference star image to overlay on all source images"""
-    __STAR_GRADIENT_IMAGE = REF_DIRECTORY / 'star_gradient.png'
+    __STAR_GRADIENT_IMAGE = str((REF_DIRECTORY / 'star_gradient.png').resolve())
+
+    """Constant ImageMagick commands surrounding the episode text labels"""
+    __EPISODE_PREFIX_COMMANDS = (
+        # Global font options
+        f'-gravity west',
+        f'-pointsize 53',
+        f'-kerning 19',
+        f'-fill "{EPISODE_TEXT_COLOR}"',
+        f'-background transparent',
+        # Font of prefix text
+        f'\\( -font "{EPISODE_TEXT_FONT}"',
+    )
+    __EPISODE_NUMBER_FONT_COMMAND = f'-font "{EPISODE_NUMBER_FONT}"'
+    __EPISODE_SUFFIX_COMMANDS = (
+        # Combine prefix and episode text
+        f'+smush 65 \\)',
+        # Add combined text to image
+        f'-geometry +325-140',
+        f'-composite',
+    )
 
     __slots__ = (
         'source_file', 'output_file', 'title_text', 'episode_text',
@@ -157,23 +175,13 @@ class StarWarsTitleCard(BaseCardType):
             return []
 
         return [
-            # Global font options
-            f'-gravity west',
-            f'-pointsize 53',
-            f'-kerning 19',
-            f'-fill "{self.EPISODE_TEXT_COLOR}"',
-            f'-background transparent',
+            *self.__EPISODE_PREFIX_COMMANDS,
             # Create prefix text
-            f'\( -font "{self.EPISODE_TEXT_FONT.resolve()}"',
             f'label:"{self.episode_prefix}"',
             # Create actual episode text
-            f'-font "{self.EPISODE_NUMBER_FONT.resolve()}"',
+            self.__EPISODE_NUMBER_FONT_COMMAND,
             f'label:"{self.episode_text}"',
-            # Combine prefix and episode text
-            f'+smush 65 \)',
-            # Add combined text to image
-            f'-geometry +325-140',
-            f'-composite',
+            *self.__EPISODE_SUFFIX_COMMANDS,
         ]
 
 
@@ -225,7 +233,7 @@ class StarWarsTitleCard(BaseCardType):
             # Resize and apply styles
             *self.resize_and_style,
             # Overlay star gradient
-            f'"{self.__STAR_GRADIENT_IMAGE.resolve()}"',
+            f'"{self.__STAR_GRADIENT_IMAGE}"',
             f'-composite',
             # Add title text
             *self.title_text_command,